@@ -1,6 +1,8 @@
 
 import abc
 import inspect
+import functools
+from typing import Any, Tuple
 
 
 class PrettyPrintable(abc.ABC):
@@ -12,8 +14,8 @@ class PrettyPrintable(abc.ABC):
 def initialization_call_string(o: object) -> str:
     parameters = {
         parameter: getattr(o, parameter)
-        for parameter, value in inspect.signature(o.__init__).parameters.items()
-        if parameter not in ['args', 'kwargs'] and value.default != getattr(o, parameter)
+        for parameter, default in _initialization_parameters(o.__class__)
+        if default != getattr(o, parameter)
     }
     if hasattr(o, 'kwargs'):
         parameters.update(o.kwargs)
@@ -22,3 +24,15 @@ def initialization_call_string(o: object) -> str:
 
 def string_with_apostrophe(s):
     return f"'{s}'" if isinstance(s, str) else s
+
+
+@functools.lru_cache(maxsize=None)
+def _initialization_parameters(cls: type) -> Tuple[Tuple[str, Any], ...]:
+    """ The parameters (and default values) of the constructor, which only depend on the class. """
+    # Skip the first parameter, which is 'self'
+    parameters = list(inspect.signature(cls.__init__).parameters.items())[1:]
+    return tuple(
+        (parameter, value.default)
+        for parameter, value in parameters
+        if parameter not in ['args', 'kwargs']
+    )
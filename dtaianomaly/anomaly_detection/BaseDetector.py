@@ -4,7 +4,7 @@ import pickle
 import enum
 import numpy as np
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, Set, Union
 
 from dtaianomaly import utils
 from dtaianomaly.PrettyPrintable import PrettyPrintable
@@ -125,6 +125,25 @@ class BaseDetector(PrettyPrintable):
         else:
             return (raw_scores - min_score) / (max_score - min_score)
 
+    @property
+    def invariances(self) -> Set[str]:
+        """
+        The kinds of transformations of the data to which this anomaly detector
+        is invariant, i.e., the predicted anomaly scores do not change if the data
+        is transformed. If ``skip_invariant_preprocessing=True``, a
+        :py:class:`~dtaianomaly.pipeline.Pipeline` skips the preprocessors of which
+        the :py:meth:`~dtaianomaly.preprocessing.Preprocessor.transform_kind`
+        is in this set. This assumes that the other preprocessors in the pipeline
+        commute with the skipped transformation, which holds for all preprocessors
+        in ``dtaianomaly``.
+
+        Returns
+        -------
+        invariances: set of str
+            The kinds of transformations to which this anomaly detector is invariant.
+        """
+        return set()
+
     def save(self, path: Union[str, Path]) -> None:
         """
         Save detector to disk as a pickle file with extension `.dtai`. If the given
@@ -141,8 +160,7 @@ class BaseDetector(PrettyPrintable):
             path = f'{path}.dtai'
 
         # Create the subdirectory, if it doesn't exist
-        if not os.path.exists(Path(path).parent):
-            os.makedirs(Path(path).parent)
+        os.makedirs(Path(path).parent, exist_ok=True)
 
         # Effectively write the anomaly detector to disk
         with open(path, 'wb') as f:
@@ -1,7 +1,6 @@
 
 import numpy as np
-import stumpy
-from typing import Optional, Union
+from typing import Optional, Set, Union
 from sklearn.exceptions import NotFittedError
 
 from dtaianomaly import utils
@@ -180,6 +179,9 @@ class MatrixProfileDetector(BaseDetector):
                                  f"in the reference data is different from the number of attributes in the test data: "
                                  f"({nb_attributes_reference} != {nb_attributes_test})!")
 
+        # Import stumpy only when needed, because it is slow to import
+        import stumpy
+
         # Stumpy assumes arrays of shape [C T], where C is the number of "channels"
         # and T the number of time samples
 
@@ -198,3 +200,11 @@ class MatrixProfileDetector(BaseDetector):
             matrix_profile = np.sum(matrix_profiles, axis=0)
 
         return reverse_sliding_window(matrix_profile, self.window_size_, 1, X.shape[0])
+
+    @property
+    def invariances(self) -> Set[str]:
+        # The z-normalized distance between subsequences does not depend on their scale and offset,
+        # except for (nearly) constant subsequences: stumpy detects these using an absolute
+        # threshold on the standard deviation (config.STUMPY_STDDEV_THRESHOLD), which does
+        # depend on the scale of the data
+        return {'affine'} if self.normalize else set()
@@ -2,7 +2,6 @@
 import math
 import scipy
 import numpy as np
-from statsmodels.tsa.stattools import acf
 from typing import Union
 from dtaianomaly import utils
 
@@ -222,6 +221,9 @@ def _dominant_fourier_frequency(X: np.ndarray, lower_bound: int, upper_bound: in
 
 
 def _highest_autocorrelation(X: np.ndarray, lower_bound: int, upper_bound: int):
+    # Import statsmodels only when needed, because it is slow to import
+    from statsmodels.tsa.stattools import acf
+
     # https://github.com/ermshaua/window-size-selection/blob/main/src/window_size/period.py#L29
     acf_values = acf(X, fft=True, nlags=int(X.shape[0]/2))
 
@@ -1,7 +1,11 @@
 
 
+import hashlib
+import joblib
 import numpy as np
-from typing import List, Optional, Union
+import numpy.typing as npt
+from typing import List, Optional, Tuple, Union
+from sklearn.utils.validation import check_memory
 
 from dtaianomaly.utils import is_valid_list
 from dtaianomaly.preprocessing import Preprocessor, ChainedPreprocessor
@@ -25,13 +29,43 @@ class Pipeline(BaseDetector):
         The preprocessors to include in this pipeline.
     detector: BaseDetector
         The anomaly detector to include in this pipeline.
+    memory: str or joblib.Memory, default=None
+        Used to cache the output of the preprocessor. If a string is given,
+        it is the path to the caching directory. By default, no caching is
+        performed. Enabling caching avoids recomputing the preprocessing if
+        the same preprocessor is applied on the same data multiple times,
+        for example when combining it with different anomaly detectors.
+        The output of each step in a list of preprocessors is cached
+        separately, such that pipelines starting with the same steps
+        reuse the cached output of these steps.
+    dtype: data-type, default=None
+        If given, the time series are converted to a C-contiguous array of
+        this data type before being preprocessed. The conversion only applies
+        to the input of the first preprocessing step: the preprocessors may
+        output a different data type, for example ``np.float64`` for the
+        :py:class:`~dtaianomaly.preprocessing.ZNormalizer` or
+        :py:class:`~dtaianomaly.preprocessing.MovingAverage`. By default, the
+        time series are passed to the preprocessor as given.
+    skip_invariant_preprocessing: bool, default=False
+        Whether to skip the preprocessing steps of which the
+        :py:meth:`~dtaianomaly.preprocessing.Preprocessor.transform_kind` is in the
+        :py:meth:`~dtaianomaly.anomaly_detection.BaseDetector.invariances` of the
+        detector, because they do not influence the predicted anomaly scores in
+        theory. In practice, the anomaly scores may differ slightly due to
+        numerical precision. The skipped steps are still fitted.
     """
     preprocessor: Preprocessor
     detector: BaseDetector
+    memory: Optional[Union[str, joblib.Memory]]
+    dtype: Optional[npt.DTypeLike]
+    skip_invariant_preprocessing: bool
 
     def __init__(self,
                  preprocessor: Union[Preprocessor, List[Preprocessor]],
-                 detector: BaseDetector):
+                 detector: BaseDetector,
+                 memory: Optional[Union[str, joblib.Memory]] = None,
+                 dtype: Optional[npt.DTypeLike] = None,
+                 skip_invariant_preprocessing: bool = False):
         if not (isinstance(preprocessor, Preprocessor) or is_valid_list(preprocessor, Preprocessor)):
             raise TypeError("preprocessor expects a Preprocessor object or list of Preprocessors")
         if not isinstance(detector, BaseDetector):
@@ -43,6 +77,9 @@ class Pipeline(BaseDetector):
         else:
             self.preprocessor = preprocessor
         self.detector = detector
+        self.memory = memory
+        self.dtype = dtype
+        self.skip_invariant_preprocessing = skip_invariant_preprocessing
 
     def fit(self, X: np.ndarray, y: Optional[np.ndarray] = None) -> 'Pipeline':
         """
@@ -54,17 +91,31 @@ class Pipeline(BaseDetector):
             Input time series.
         y: array-like of shape (n_samples)
             The ground truth labels, passed to the preprocessor and detector.
+            The labels must be binary, and are converted once to a read-only
+            ``np.int8`` array, which is shared by all steps without additional
+            copies.
 
         Returns
         -------
         self: Pipeline
             Returns the instance itself
+
+        Raises
+        ------
+        ValueError
+            If the given ground truth labels are not binary.
         """
-        X, y = self.preprocessor.fit_transform(X=X, y=y)
+        if y is not None:
+            y = np.asarray(y)
+            if not np.isin(y, (0, 1)).all():
+                raise ValueError("The ground truth labels should be binary")
+            y = y.astype(np.int8, copy=False).view()
+            y.flags.writeable = False
+        X, y = self._fit_transform_preprocessor(X, y)
         self.detector.fit(X=X, y=y)
         return self
 
-    def decision_function(self, X: np.ndarray) -> np.ndarray:
+    def decision_function(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Compute raw anomaly scores.
 
@@ -75,14 +126,156 @@ class Pipeline(BaseDetector):
         ----------
         X: array-like of shape (n_samples, n_attributes)
             Raw time series
+        out: np.ndarray of shape (n_samples), default=None
+            If given, the anomaly scores are written into this array, which
+            is also returned. This can for example be a ``np.memmap``, such
+            that the anomaly scores are written directly to disk.
 
         Returns
         -------
         anomaly_scores: array-like of shape (n_samples)
             The predicted anomaly scores
         """
-        X, _ = self.preprocessor.transform(X=X, y=None)
-        return self.detector.decision_function(X)
+        X = self._transform_preprocessor(X)
+        decision_scores = self.detector.decision_function(X)
+        if out is None:
+            return decision_scores
+        np.copyto(out, decision_scores)
+        return out
+
+    def decision_function_batch(self, Xs: List[np.ndarray], n_jobs: int = 1) -> List[np.ndarray]:
+        """
+        Compute raw anomaly scores for multiple time series.
+
+        If the preprocessor is batch-safe (see :py:meth:`~dtaianomaly.preprocessing.Preprocessor.is_batch_safe`),
+        then all time series are concatenated and preprocessed at once.
+        Otherwise, each time series is preprocessed separately. The anomaly
+        detector is always applied on each time series separately, to ensure
+        that windows do not cross the boundary of two time series. These
+        computations are independent of each other, and can be run in
+        parallel using ``joblib``.
+
+        Parameters
+        ----------
+        Xs: list of array-likes of shape (n_samples, n_attributes)
+            The raw time series, which may have a different number of samples.
+        n_jobs: int, default=1
+            The number of processes to run in parallel. If -1, then all
+            processors are used.
+
+        Returns
+        -------
+        anomaly_scores: list of array-likes of shape (n_samples)
+            The predicted anomaly scores of each time series.
+        """
+        if self.preprocessor.is_batch_safe and len(Xs) > 1:
+            lengths = [len(X) for X in Xs]
+            X_concatenated = self._transform_preprocessor(np.concatenate([np.asarray(X) for X in Xs], axis=0))
+            Xs = np.split(X_concatenated, np.cumsum(lengths)[:-1])
+            function = self.detector.decision_function
+        else:
+            function = self.decision_function
+        return joblib.Parallel(n_jobs=n_jobs)(joblib.delayed(function)(X) for X in Xs)
+
+    @property
+    def preprocessor_steps(self) -> List[Preprocessor]:
+        """
+        The individual preprocessing steps of this pipeline. If the preprocessor
+        is a :py:class:`~dtaianomaly.preprocessing.ChainedPreprocessor`, then
+        these are its base preprocessors, otherwise this is a list containing
+        only the preprocessor of this pipeline. A new list is returned, such that
+        modifying it does not affect the pipeline.
+        """
+        if isinstance(self.preprocessor, ChainedPreprocessor):
+            return list(self.preprocessor.base_preprocessors)
+        return [self.preprocessor]
+
+    def _fit_transform_preprocessor(self, X: np.ndarray, y: Optional[np.ndarray]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        X = self._convert_dtype(X)
+        memory = check_memory(self.memory)
+        steps = self.preprocessor_steps
+        if memory.location is None and not any(map(self._is_skipped, steps)):
+            return self.preprocessor.fit_transform(X=X, y=y)
+
+        # Cache the output of each step under a causal hash of all the previous
+        # steps, such that pipelines sharing a prefix of steps reuse the results
+        if memory.location is not None:
+            key = _causal_hash(_hash_array(X), _hash_array(y))
+        for step in steps:
+            if self._is_skipped(step):
+                # Still fit the step, such that the preprocessor can be used on its own
+                step.fit(X=X, y=y)
+            elif memory.location is None:
+                X, y = step.fit_transform(X=X, y=y)
+            else:
+                key = _causal_hash(str(step), key)
+                X, y, fitted_step = memory.cache(_fit_transform_step, ignore=['preprocessor', 'X', 'y'])(key, step, X, y)
+                # On a cache hit, copy the fitted state into the given step, such that
+                # the step is fitted in place, as when no memory is used
+                if fitted_step is not step:
+                    step.__dict__.update(fitted_step.__dict__)
+        return X, y
+
+    def _transform_preprocessor(self, X: np.ndarray) -> np.ndarray:
+        X = self._convert_dtype(X)
+        memory = check_memory(self.memory)
+        steps = self.preprocessor_steps
+        if memory.location is None and not any(map(self._is_skipped, steps)):
+            X, _ = self.preprocessor.transform(X=X, y=None)
+            return X
+
+        # The fitted state of each step is included in the causal hash
+        if memory.location is not None:
+            key = _hash_array(X)
+        for step in steps:
+            if self._is_skipped(step):
+                continue
+            elif memory.location is None:
+                X, _ = step.transform(X=X, y=None)
+            else:
+                key = _causal_hash(joblib.hash(step), key)
+                X = memory.cache(_transform_step, ignore=['preprocessor', 'X'])(key, step, X)
+        return X
+
+    def _is_skipped(self, step: Preprocessor) -> bool:
+        """ Whether the given step can be skipped because the detector is invariant to its transformation. """
+        return (self.skip_invariant_preprocessing
+                and step.transform_kind is not None
+                and step.transform_kind in self.detector.invariances)
+
+    def _convert_dtype(self, X: np.ndarray) -> np.ndarray:
+        if self.dtype is None:
+            return X
+        return np.ascontiguousarray(X, dtype=self.dtype)
 
     def __str__(self) -> str:
         return f'{self.preprocessor}->{self.detector}'
+
+
+def _hash_array(X: Optional[np.ndarray]) -> str:
+    """ Hash the raw buffer of the given array, which is much faster than pickling it as ``joblib.hash`` does. """
+    if X is None:
+        return ''
+    X = np.ascontiguousarray(X)
+    if X.dtype.hasobject:
+        return joblib.hash(X)
+    hash_ = hashlib.sha256(f'{X.dtype.str}{X.shape}'.encode())
+    hash_.update(X.view(np.uint8))
+    return hash_.hexdigest()
+
+
+def _causal_hash(step: str, previous_key: str) -> str:
+    """ Hash the given step description together with the key of the previous step. """
+    return hashlib.blake2b((step + previous_key).encode()).hexdigest()
+
+
+def _fit_transform_step(key: str, preprocessor: Preprocessor, X: np.ndarray, y: Optional[np.ndarray]) -> Tuple[np.ndarray, Optional[np.ndarray], Preprocessor]:
+    """ Fit and transform a single step, and also return the fitted step such that it is stored in the cache. """
+    X, y = preprocessor.fit_transform(X=X, y=y)
+    return X, y, preprocessor
+
+
+def _transform_step(key: str, preprocessor: Preprocessor, X: np.ndarray) -> np.ndarray:
+    """ Transform the given data with a single (fitted) step. """
+    X, _ = preprocessor.transform(X=X, y=None)
+    return X
@@ -47,5 +47,9 @@ class ChainedPreprocessor(Preprocessor):
             X, y = preprocessor._transform(X, y)
         return X, y
 
+    @property
+    def is_batch_safe(self) -> bool:
+        return all(preprocessor.is_batch_safe for preprocessor in self.base_preprocessors)
+
     def __str__(self):
         return '->'.join(map(str, self.base_preprocessors))
@@ -1,4 +1,5 @@
 
+import numba as nb
 import numpy as np
 from typing import Optional, Tuple
 
@@ -34,5 +35,17 @@ class ExponentialMovingAverage(Preprocessor):
         return self
 
     def _transform(self, X: np.ndarray, y: Optional[np.ndarray] = None) -> Tuple[np.ndarray, Optional[np.ndarray]]:
-        X_ = np.frompyfunc(lambda a, b: self.alpha * a + (1 - self.alpha) * b, 2, 1).accumulate(X).astype(dtype=float)
-        return X_, y
+        X_ = _exponential_moving_average(X.reshape(-1, 1) if X.ndim == 1 else X, self.alpha)
+        return X_.reshape(X.shape), y
+
+
+@nb.njit(cache=True)
+def _exponential_moving_average(X: np.ndarray, alpha: float) -> np.ndarray:
+    X_ = np.empty(X.shape, dtype=np.float64)
+    for t in range(X.shape[0]):
+        for attribute in range(X.shape[1]):
+            if t == 0:
+                X_[t, attribute] = X[t, attribute]
+            else:
+                X_[t, attribute] = alpha * X_[t - 1, attribute] + (1 - alpha) * X[t, attribute]
+    return X_
@@ -62,3 +62,11 @@ class MinMaxScaler(Preprocessor):
 
         X_ = (X - self.min_) / (self.max_ - self.min_)
         return X_, y
+
+    @property
+    def transform_kind(self) -> Optional[str]:
+        return 'affine'
+
+    @property
+    def is_batch_safe(self) -> bool:
+        return True
@@ -1,4 +1,5 @@
 
+import numba as nb
 import numpy as np
 from typing import Optional, Tuple
 
@@ -35,14 +36,25 @@ class MovingAverage(Preprocessor):
         return self
 
     def _transform(self, X: np.ndarray, y: Optional[np.ndarray] = None) -> Tuple[np.ndarray, Optional[np.ndarray]]:
-        # Add nan values at the beginning and end of the given array
-        extend_front = np.full(self.window_size//2, np.nan)
-        extend_back = np.full(self.window_size//2 - (self.window_size % 2 == 0), np.nan)
-        if len(X.shape) == 2:
-            extend_front = np.repeat(extend_front, X.shape[1]).reshape(-1, X.shape[1])
-            extend_back = np.repeat(extend_back, X.shape[1]).reshape(-1, X.shape[1])
-        X_extended = np.concatenate([extend_front, X, extend_back], axis=0)
-        # Compute the average within each window
-        X_ = np.array([np.nanmean(window, axis=-1) for window in np.lib.stride_tricks.sliding_window_view(X_extended, self.window_size, axis=0)])
-        # Return the results
-        return X_, y
+        X_ = _moving_average(X.reshape(-1, 1) if X.ndim == 1 else X, self.window_size)
+        return X_.reshape(X.shape), y
+
+
+@nb.njit(cache=True)
+def _moving_average(X: np.ndarray, window_size: int) -> np.ndarray:
+    nb_before = window_size // 2
+    nb_after = window_size // 2 - (window_size % 2 == 0)
+    X_ = np.empty(X.shape, dtype=np.float64)
+    for t in range(X.shape[0]):
+        start = max(0, t - nb_before)
+        end = min(X.shape[0], t + nb_after + 1)
+        for attribute in range(X.shape[1]):
+            # Ignore the nan-values, similar to np.nanmean
+            total = 0.0
+            count = 0
+            for i in range(start, end):
+                if not np.isnan(X[i, attribute]):
+                    total += X[i, attribute]
+                    count += 1
+            X_[t, attribute] = total / count if count > 0 else np.nan
+    return X_
@@ -116,6 +116,40 @@ class Preprocessor(PrettyPrintable):
         """
         return self.fit(X, y).transform(X, y)
 
+    @property
+    def transform_kind(self) -> Optional[str]:
+        """
+        The kind of transformation applied by this preprocessor. If an anomaly
+        detector is invariant to this kind of transformation (see
+        :py:meth:`~dtaianomaly.anomaly_detection.BaseDetector.invariances`), then
+        a :py:class:`~dtaianomaly.pipeline.Pipeline` can skip this preprocessor.
+        Valid kinds are:
+
+        - ``'affine'``: each attribute is scaled by a positive factor and shifted.
+
+        Returns
+        -------
+        transform_kind: str or None
+            The kind of transformation, or None if this preprocessor does not
+            apply one of the above transformations.
+        """
+        return None
+
+    @property
+    def is_batch_safe(self) -> bool:
+        """
+        Whether this preprocessor transforms each sample independently of the
+        other samples, once it has been fitted. If this is the case, multiple
+        time series can be concatenated and transformed at once, which gives
+        the same result as transforming each time series separately.
+
+        Returns
+        -------
+        is_batch_safe: bool
+            True if each sample is transformed independently, False otherwise.
+        """
+        return False
+
 
 class Identity(Preprocessor):
     """
@@ -126,3 +160,7 @@ class Identity(Preprocessor):
 
     def _transform(self, X: np.ndarray, y: Optional[np.ndarray] = None) -> Tuple[np.ndarray, Optional[np.ndarray]]:
         return X, y
+
+    @property
+    def is_batch_safe(self) -> bool:
+        return True
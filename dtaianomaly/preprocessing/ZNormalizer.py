@@ -69,11 +69,19 @@ class ZNormalizer(Preprocessor):
             X_ = X
 
         # Else, each attribute is normalized independently, except for the
-        # attributes with 0 std.
+        # attributes with 0 std, which are shifted by 0 and scaled by 1. The
+        # division happens in place to avoid allocating a second array.
         else:
-            X_ = (X - self.mean_) / self.std_
-            for i, (std) in enumerate(self.std_):
-                if std < self.min_std:
-                    X_[:, i] = X[:, i]
+            normalize = ~(self.std_ < self.min_std)
+            X_ = X - np.where(normalize, self.mean_, 0)
+            X_ /= np.where(normalize, self.std_, 1)
 
         return X_, y
+
+    @property
+    def transform_kind(self) -> Optional[str]:
+        return 'affine'
+
+    @property
+    def is_batch_safe(self) -> bool:
+        return True
@@ -21,9 +21,9 @@ def log_error(error_log_path: str, exception: Exception, data_loader: LazyDataLo
     # Ensure that the file name is unique
     while True:
         now = datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        if not os.path.exists(f'{error_log_path}/{base_file_name}-{now}.err'):
+        file_path = os.path.join(error_log_path, f'{base_file_name}-{now}.err')
+        if not os.path.exists(file_path):
             break
-    file_path = f'{error_log_path}/{base_file_name}-{now}.err'
 
     # Write away the logging
     with open(file_path, 'w') as error_file:
@@ -1,6 +1,9 @@
 
 import os
+import copy
 import json
+import pathlib
+import functools
 from itertools import chain
 
 from dtaianomaly.workflow import Workflow
@@ -40,20 +43,27 @@ def workflow_from_config(path: str, max_size: int = 1000000):
     if not path.endswith('.json'):
         raise ValueError('The given path should be a json file!')
 
-    with open(path, 'r') as file:
-        # Check file size
-        file.seek(0, 2)
-        file_size = file.tell()
-        if file_size > max_size:
-            raise ValueError(f"File size exceeds maximum size of {max_size} bytes")
-        file.seek(0)
+    # Check file size
+    stat = os.stat(path)
+    if stat.st_size > max_size:
+        raise ValueError(f"File size exceeds maximum size of {max_size} bytes")
 
-        # Parse actual JSON
-        parsed_config = json.load(file)
+    # Parse actual JSON
+    parsed_config = copy.deepcopy(_parse_config(path, stat.st_mtime_ns, stat.st_size))
 
     return interpret_config(parsed_config)
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_config(path: str, modification_time: int, size: int) -> dict:
+    """
+    Parse the given JSON file. The result is reused as long as the modification
+    time and size of the file do not change. The returned dictionary is shared
+    among all calls, and should therefore not be modified.
+    """
+    return json.loads(pathlib.Path(path).read_bytes())
+
+
 def interpret_config(config: dict):
     """
     Actual parsing/interpretation logic
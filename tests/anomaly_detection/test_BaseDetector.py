@@ -94,3 +94,6 @@ class TestBaseDetector:
     def test_str(self):
         assert str(baselines.RandomDetector()) == 'RandomDetector()'
         assert str(baselines.AlwaysNormal()) == 'AlwaysNormal()'
+
+    def test_invariances(self):
+        assert baselines.AlwaysNormal().invariances == set()
@@ -1,5 +1,6 @@
 
 import pytest
+import numpy as np
 from sklearn.exceptions import NotFittedError
 from dtaianomaly.anomaly_detection import MatrixProfileDetector, Supervision
 
@@ -110,3 +111,13 @@ class TestMatrixProfileDetector:
         assert str(MatrixProfileDetector(15, normalize=False, p=1.5)) == "MatrixProfileDetector(window_size=15,normalize=False,p=1.5)"
         assert str(MatrixProfileDetector(15, p=1.5, normalize=False)) == "MatrixProfileDetector(window_size=15,normalize=False,p=1.5)"
         assert str(MatrixProfileDetector(25, k=2)) == "MatrixProfileDetector(window_size=25,k=2)"
+
+    def test_invariances(self, univariate_time_series):
+        detector = MatrixProfileDetector(15)
+        assert 'affine' in detector.invariances
+        X_ = 3.7 * univariate_time_series - 12.1
+        decision_function = detector.fit(univariate_time_series).decision_function(univariate_time_series)
+        assert np.allclose(decision_function, detector.fit(X_).decision_function(X_))
+
+    def test_invariances_not_normalized(self):
+        assert 'affine' not in MatrixProfileDetector(15, normalize=False).invariances
@@ -1,11 +1,37 @@
 import pytest
+import joblib
+import numpy as np
 
-from dtaianomaly.preprocessing import Identity, ZNormalizer, ChainedPreprocessor
-from dtaianomaly.anomaly_detection import IsolationForest
+from dtaianomaly.preprocessing import Preprocessor, Identity, ZNormalizer, ChainedPreprocessor, MovingAverage
+from dtaianomaly.anomaly_detection import IsolationForest, LocalOutlierFactor, MatrixProfileDetector
 
 from dtaianomaly.pipeline import Pipeline
 
 
+class CountingPreprocessor(Preprocessor):
+    nb_transforms = 0
+
+    def __init__(self, offset: int = 0):
+        self.offset = offset
+
+    def _fit(self, X, y=None):
+        return self
+
+    def _transform(self, X, y=None):
+        CountingPreprocessor.nb_transforms += 1
+        return X + self.offset, y
+
+
+class LabelRecordingPreprocessor(Preprocessor):
+
+    def _fit(self, X, y=None):
+        self.y_ = y
+        return self
+
+    def _transform(self, X, y=None):
+        return X, y
+
+
 class TestPipeline:
 
     def test_initialization(self):
@@ -35,4 +61,228 @@ class TestPipeline:
         assert (str(Pipeline(ChainedPreprocessor(Identity(), ZNormalizer()), IsolationForest(15, 3)))
                 == 'Identity()->ZNormalizer()->IsolationForest(window_size=15,stride=3)')
 
+    def test_memory_str(self, tmp_path, univariate_time_series):
+        pipeline = Pipeline(ZNormalizer(), IsolationForest(15), memory=str(tmp_path))
+        pipeline.fit(univariate_time_series)
+        assert len(list(tmp_path.iterdir())) > 0
+
+    def test_memory_object(self, tmp_path, univariate_time_series):
+        pipeline = Pipeline(ZNormalizer(), IsolationForest(15), memory=joblib.Memory(tmp_path, verbose=0))
+        pipeline.fit(univariate_time_series)
+        assert len(list(tmp_path.iterdir())) > 0
+
+    def test_memory_same_result(self, tmp_path, univariate_time_series):
+        expected = Pipeline(ZNormalizer(), IsolationForest(15, random_state=0)).fit(univariate_time_series).decision_function(univariate_time_series)
+        for _ in range(2):
+            pipeline = Pipeline(ZNormalizer(), IsolationForest(15, random_state=0), memory=str(tmp_path))
+            decision_function = pipeline.fit(univariate_time_series).decision_function(univariate_time_series)
+            assert np.array_equal(expected, decision_function)
+
+    def test_memory_reuses_preprocessing(self, tmp_path, univariate_time_series):
+        CountingPreprocessor.nb_transforms = 0
+        Pipeline(CountingPreprocessor(), IsolationForest(15), memory=str(tmp_path)).fit(univariate_time_series)
+        assert CountingPreprocessor.nb_transforms == 1
+        Pipeline(CountingPreprocessor(), IsolationForest(32), memory=str(tmp_path)).fit(univariate_time_series)
+        assert CountingPreprocessor.nb_transforms == 1
+
+    def test_memory_invalid(self):
+        with pytest.raises(ValueError):
+            Pipeline(ZNormalizer(), IsolationForest(15), memory=5).fit(np.arange(100))
+
+    def test_memory_reuses_prefix(self, tmp_path, univariate_time_series):
+        CountingPreprocessor.nb_transforms = 0
+        Pipeline([CountingPreprocessor(1)], IsolationForest(15), memory=str(tmp_path)).fit(univariate_time_series)
+        assert CountingPreprocessor.nb_transforms == 1
+        Pipeline([CountingPreprocessor(1), CountingPreprocessor(2)], IsolationForest(15), memory=str(tmp_path)).fit(univariate_time_series)
+        assert CountingPreprocessor.nb_transforms == 2
+        Pipeline([CountingPreprocessor(1), CountingPreprocessor(2), CountingPreprocessor(3)], IsolationForest(15), memory=str(tmp_path)).fit(univariate_time_series)
+        assert CountingPreprocessor.nb_transforms == 3
+        Pipeline([CountingPreprocessor(1), CountingPreprocessor(3)], IsolationForest(15), memory=str(tmp_path)).fit(univariate_time_series)
+        assert CountingPreprocessor.nb_transforms == 4
+
+    def test_memory_chained_same_result(self, tmp_path, univariate_time_series):
+        expected = Pipeline([ZNormalizer(), CountingPreprocessor(1)], IsolationForest(15, random_state=0)).fit(univariate_time_series).decision_function(univariate_time_series)
+        for _ in range(2):
+            pipeline = Pipeline([ZNormalizer(), CountingPreprocessor(1)], IsolationForest(15, random_state=0), memory=str(tmp_path))
+            decision_function = pipeline.fit(univariate_time_series).decision_function(univariate_time_series)
+            assert np.array_equal(expected, decision_function)
+            assert hasattr(pipeline.preprocessor_steps[0], 'mean_')
+
+    def test_memory_transform_depends_on_fit(self, tmp_path, univariate_time_series):
+        pipeline = Pipeline(ZNormalizer(), LocalOutlierFactor(15), memory=str(tmp_path))
+        X_first = pipeline.fit(univariate_time_series)._transform_preprocessor(univariate_time_series)
+        X_second = pipeline.fit(univariate_time_series * 2)._transform_preprocessor(univariate_time_series)
+        assert not np.array_equal(X_first, X_second)
+
+    def test_memory_fits_given_steps(self, tmp_path, univariate_time_series):
+        Pipeline([ZNormalizer(), MovingAverage(3)], LocalOutlierFactor(15), memory=str(tmp_path)).fit(univariate_time_series)
+        z_normalizer = ZNormalizer()
+        steps = [z_normalizer, MovingAverage(3)]
+        pipeline = Pipeline(steps, LocalOutlierFactor(15), memory=str(tmp_path)).fit(univariate_time_series)
+        assert steps[0] is z_normalizer
+        assert pipeline.preprocessor_steps[0] is z_normalizer
+        assert hasattr(z_normalizer, 'mean_')
+
+    def test_memory_fits_given_preprocessor(self, tmp_path, univariate_time_series):
+        Pipeline(ZNormalizer(), LocalOutlierFactor(15), memory=str(tmp_path)).fit(univariate_time_series)
+        z_normalizer = ZNormalizer()
+        pipeline = Pipeline(z_normalizer, LocalOutlierFactor(15), memory=str(tmp_path)).fit(univariate_time_series)
+        assert pipeline.preprocessor is z_normalizer
+        assert hasattr(z_normalizer, 'mean_')
+
+    def test_preprocessor_steps(self):
+        assert len(Pipeline(ZNormalizer(), IsolationForest(15)).preprocessor_steps) == 1
+        assert len(Pipeline([ZNormalizer(), Identity()], IsolationForest(15)).preprocessor_steps) == 2
+
+    def test_preprocessor_steps_copy(self):
+        pipeline = Pipeline([ZNormalizer(), Identity()], IsolationForest(15))
+        pipeline.preprocessor_steps.append(Identity())
+        assert len(pipeline.preprocessor_steps) == 2
+
+    @pytest.mark.parametrize('preprocessor', [ZNormalizer(), MovingAverage(5), [ZNormalizer(), Identity()]])
+    def test_decision_function_batch(self, preprocessor, univariate_time_series):
+        pipeline = Pipeline(preprocessor, IsolationForest(15, random_state=0)).fit(univariate_time_series)
+        Xs = [univariate_time_series[:300], univariate_time_series[300:], univariate_time_series * 2]
+        decision_functions = pipeline.decision_function_batch(Xs)
+        assert len(decision_functions) == len(Xs)
+        for X, decision_function in zip(Xs, decision_functions):
+            assert np.allclose(pipeline.decision_function(X), decision_function)
+
+    @pytest.mark.parametrize('preprocessor', [ZNormalizer(), MovingAverage(5)])
+    def test_decision_function_batch_parallel(self, preprocessor, tmp_path, univariate_time_series):
+        pipeline = Pipeline(preprocessor, IsolationForest(15, random_state=0), memory=str(tmp_path)).fit(univariate_time_series)
+        Xs = [univariate_time_series[:300], univariate_time_series[300:], univariate_time_series * 2]
+        expected = pipeline.decision_function_batch(Xs)
+        decision_functions = pipeline.decision_function_batch(Xs, n_jobs=2)
+        assert len(decision_functions) == len(Xs)
+        for e, decision_function in zip(expected, decision_functions):
+            assert np.array_equal(e, decision_function)
+
+    def test_decision_function_batch_single(self, univariate_time_series):
+        pipeline = Pipeline(ZNormalizer(), IsolationForest(15, random_state=0)).fit(univariate_time_series)
+        decision_functions = pipeline.decision_function_batch([univariate_time_series])
+        assert len(decision_functions) == 1
+        assert np.array_equal(pipeline.decision_function(univariate_time_series), decision_functions[0])
+
+    def test_dtype(self, univariate_time_series):
+        pipeline = Pipeline(Identity(), IsolationForest(15), dtype=np.float32)
+        X = np.asfortranarray(np.stack([univariate_time_series, univariate_time_series], axis=1))
+        X_ = pipeline.fit(X)._transform_preprocessor(X)
+        assert X_.dtype == np.float32
+        assert X_.flags['C_CONTIGUOUS']
+
+    def test_dtype_none(self, univariate_time_series):
+        pipeline = Pipeline(Identity(), IsolationForest(15))
+        X_ = pipeline.fit(univariate_time_series)._transform_preprocessor(univariate_time_series)
+        assert X_ is univariate_time_series
+
+    def test_dtype_decision_function(self, univariate_time_series):
+        expected = Pipeline(ZNormalizer(), IsolationForest(15, random_state=0)).fit(univariate_time_series).decision_function(univariate_time_series)
+        pipeline = Pipeline(ZNormalizer(), IsolationForest(15, random_state=0), dtype=np.float32)
+        decision_function = pipeline.fit(univariate_time_series).decision_function(univariate_time_series)
+        assert decision_function.shape == expected.shape
+        assert np.corrcoef(expected, decision_function)[0, 1] > 0.99
+
+    def test_dtype_invalid_array(self):
+        with pytest.raises(ValueError):
+            Pipeline(ZNormalizer(), IsolationForest(15), dtype=np.float32).fit(['foo', 'bar'])
+
+    def test_decision_function_out(self, univariate_time_series):
+        pipeline = Pipeline(ZNormalizer(), IsolationForest(15, random_state=0)).fit(univariate_time_series)
+        out = np.empty(univariate_time_series.shape[0])
+        decision_function = pipeline.decision_function(univariate_time_series, out=out)
+        assert decision_function is out
+        assert np.array_equal(pipeline.decision_function(univariate_time_series), out)
+
+    def test_decision_function_out_memmap(self, tmp_path, univariate_time_series):
+        pipeline = Pipeline(ZNormalizer(), IsolationForest(15, random_state=0)).fit(univariate_time_series)
+        out = np.memmap(tmp_path / 'scores.dat', dtype=np.float32, mode='w+', shape=(univariate_time_series.shape[0],))
+        pipeline.decision_function(univariate_time_series, out=out)
+        out.flush()
+        scores = np.memmap(tmp_path / 'scores.dat', dtype=np.float32, mode='r')
+        assert np.allclose(pipeline.decision_function(univariate_time_series), scores)
+
+    def test_decision_function_out_invalid_shape(self, univariate_time_series):
+        pipeline = Pipeline(ZNormalizer(), IsolationForest(15)).fit(univariate_time_series)
+        with pytest.raises(ValueError):
+            pipeline.decision_function(univariate_time_series, out=np.empty(10))
+
+    def test_memory_different_shape(self, tmp_path, univariate_time_series):
+        pipeline = Pipeline(Identity(), IsolationForest(15), memory=str(tmp_path))
+        X = univariate_time_series[:900]
+        assert pipeline.fit(X)._transform_preprocessor(X.reshape(-1, 3)).shape == (300, 3)
+        assert pipeline._transform_preprocessor(X.reshape(-1, 1)).shape == (900, 1)
+        assert pipeline._transform_preprocessor(X.astype(np.float32)).dtype == np.float32
+
+    def test_skip_invariant_preprocessor(self, univariate_time_series):
+        expected = Pipeline(Identity(), MatrixProfileDetector(15)).fit(univariate_time_series).decision_function(univariate_time_series)
+        pipeline = Pipeline(ZNormalizer(), MatrixProfileDetector(15), skip_invariant_preprocessing=True).fit(univariate_time_series)
+        assert np.allclose(expected, pipeline.decision_function(univariate_time_series))
+        assert pipeline._transform_preprocessor(univariate_time_series) is univariate_time_series
+        assert hasattr(pipeline.preprocessor, 'mean_')  # The preprocessor is still fitted
+
+    def test_skip_invariant_preprocessor_default(self, univariate_time_series):
+        pipeline = Pipeline(ZNormalizer(), MatrixProfileDetector(15)).fit(univariate_time_series)
+        X_ = pipeline._transform_preprocessor(univariate_time_series)
+        assert np.isclose(X_.mean(), 0.0)
+        assert np.isclose(X_.std(), 1.0)
+
+    def test_skip_invariant_preprocessor_in_chain(self, univariate_time_series):
+        CountingPreprocessor.nb_transforms = 0
+        pipeline = Pipeline([ZNormalizer(), CountingPreprocessor(1)], MatrixProfileDetector(15), skip_invariant_preprocessing=True).fit(univariate_time_series)
+        X_ = pipeline._transform_preprocessor(univariate_time_series)
+        assert CountingPreprocessor.nb_transforms == 2
+        assert np.array_equal(X_, univariate_time_series + 1)
+
+    def test_skip_invariant_preprocessor_memory(self, tmp_path, univariate_time_series):
+        pipeline = Pipeline([ZNormalizer(), CountingPreprocessor(1)], MatrixProfileDetector(15), memory=str(tmp_path), skip_invariant_preprocessing=True).fit(univariate_time_series)
+        assert np.array_equal(pipeline._transform_preprocessor(univariate_time_series), univariate_time_series + 1)
+
+    @pytest.mark.parametrize('detector', [IsolationForest(15), LocalOutlierFactor(15), MatrixProfileDetector(15, normalize=False)])
+    def test_no_skip_if_not_invariant(self, detector, univariate_time_series):
+        pipeline = Pipeline(ZNormalizer(), detector, skip_invariant_preprocessing=True).fit(univariate_time_series)
+        X_ = pipeline._transform_preprocessor(univariate_time_series)
+        assert np.isclose(X_.mean(), 0.0)
+        assert np.isclose(X_.std(), 1.0)
+
+    def test_large_offset_small_variance(self):
+        rng = np.random.default_rng(0)
+        X = 1e6 + 0.01 * np.sin(np.linspace(0, 50, 1000)) + 0.001 * rng.normal(size=1000)
+        X_normalized, _ = ZNormalizer().fit_transform(X)
+        expected = IsolationForest(16, random_state=0).fit(X_normalized).decision_function(X_normalized)
+        for skip_invariant_preprocessing in [False, True]:
+            pipeline = Pipeline(ZNormalizer(), IsolationForest(16, random_state=0), skip_invariant_preprocessing=skip_invariant_preprocessing)
+            assert np.allclose(expected, pipeline.fit(X).decision_function(X))
+
+    def test_labels_read_only_int8(self, univariate_time_series):
+        y = np.random.default_rng(0).choice([0, 1], size=univariate_time_series.shape[0])
+        pipeline = Pipeline(LabelRecordingPreprocessor(), IsolationForest(15)).fit(univariate_time_series, y)
+        assert pipeline.preprocessor.y_.dtype == np.int8
+        assert not pipeline.preprocessor.y_.flags.writeable
+        assert np.array_equal(pipeline.preprocessor.y_, y)
+
+    def test_labels_list(self, univariate_time_series):
+        y = [0, 1] * (univariate_time_series.shape[0] // 2)
+        pipeline = Pipeline(LabelRecordingPreprocessor(), IsolationForest(15)).fit(univariate_time_series[:len(y)], y)
+        assert np.array_equal(pipeline.preprocessor.y_, y)
+
+    def test_labels_caller_array_unchanged(self, univariate_time_series):
+        y = np.zeros(univariate_time_series.shape[0], dtype=np.int8)
+        pipeline = Pipeline(LabelRecordingPreprocessor(), IsolationForest(15)).fit(univariate_time_series, y)
+        assert np.shares_memory(pipeline.preprocessor.y_, y)
+        assert y.flags.writeable
+
+    @pytest.mark.parametrize('y', [[0, 0.7, 1], [0, 128, 1], [0, np.nan, 1], [0, -1, 1]])
+    def test_labels_invalid(self, y):
+        with pytest.raises(ValueError):
+            Pipeline(LabelRecordingPreprocessor(), IsolationForest(1)).fit(np.array([1.0, 2.0, 3.0]), y)
+
+    @pytest.mark.parametrize('y', [[False, True, False], [0.0, 1.0, 0.0]])
+    def test_labels_binary_other_type(self, y):
+        pipeline = Pipeline(LabelRecordingPreprocessor(), IsolationForest(1)).fit(np.array([1.0, 2.0, 3.0]), y)
+        assert np.array_equal(pipeline.preprocessor.y_, [0, 1, 0])
+        assert pipeline.preprocessor.y_.dtype == np.int8
 
+    def test_labels_none(self, univariate_time_series):
+        pipeline = Pipeline(LabelRecordingPreprocessor(), IsolationForest(15)).fit(univariate_time_series)
+        assert pipeline.preprocessor.y_ is None
@@ -40,6 +40,12 @@ class TestMovingAverage:
         assert np.array_equal(x_, np.array([[3, 30], [3, 30], [5, 50], [6, 60], [7, 70], [6, 60], [7, 70], [7.5, 75]]))
         assert np.array_equal(y_, y)
 
+    def test_nan_values(self):
+        x = np.array([1, np.nan, 3, 7, np.nan, np.nan, np.nan, 11])
+        preprocessor = MovingAverage(3)
+        x_, _ = preprocessor.fit_transform(x)
+        assert np.array_equal(x_, np.array([1, 2, 5, 5, 7, np.nan, 11, 11]), equal_nan=True)
+
     def test_univariate(self, univariate_time_series):
         x_, _ = MovingAverage(42).fit_transform(univariate_time_series)
         assert x_.shape == univariate_time_series.shape
@@ -138,3 +138,6 @@ class TestIdentity:
 
     def test_str(self):
         assert str(Identity()) == 'Identity()'
+
+    def test_transform_kind(self):
+        assert Identity().transform_kind is None
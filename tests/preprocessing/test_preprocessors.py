@@ -61,3 +61,22 @@ class TestPreprocessors:
         X_, y_ = preprocessor.fit_transform(X, ground_truth)
         assert utils.is_valid_array_like(X_)
         assert utils.is_valid_array_like(y_)
+
+    def test_is_batch_safe(self, preprocessor, multivariate_time_series):
+        if not preprocessor.is_batch_safe:
+            pytest.skip(f'{preprocessor} is not batch-safe')
+        preprocessor.fit(multivariate_time_series)
+        X_first, X_second = multivariate_time_series[:200], multivariate_time_series[200:]
+        X_concatenated, _ = preprocessor.transform(np.concatenate([X_first, X_second]))
+        X_first_, _ = preprocessor.transform(X_first)
+        X_second_, _ = preprocessor.transform(X_second)
+        assert np.allclose(X_concatenated, np.concatenate([X_first_, X_second_]))
+
+    def test_transform_kind_affine(self, preprocessor, multivariate_time_series):
+        if preprocessor.transform_kind != 'affine':
+            pytest.skip(f'{preprocessor} is not an affine transformation')
+        X_, _ = preprocessor.fit_transform(multivariate_time_series)
+        for attribute in range(multivariate_time_series.shape[1]):
+            scale, shift = np.polyfit(multivariate_time_series[:, attribute], X_[:, attribute], deg=1)
+            assert scale > 0
+            assert np.allclose(scale * multivariate_time_series[:, attribute] + shift, X_[:, attribute])
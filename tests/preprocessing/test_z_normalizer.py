@@ -42,6 +42,13 @@ class TestZNormalizer:
             assert x_[:, i].mean() == pytest.approx(0.0)
             assert x_[:, i].std() == pytest.approx(1.0)
 
+    def test_multivariate_with_nan_std_attribute(self):
+        preprocessor = ZNormalizer()
+        preprocessor.fit(np.array([[np.nan, 1], [np.nan, 2], [np.nan, 3]]))
+        x_, _ = preprocessor.transform(np.array([[5.0, 1.0]]))
+        assert np.isnan(x_[0, 0])
+        assert x_[0, 1] == pytest.approx(-1.0 / np.std([1, 2, 3]))
+
     def test_different_dimension(self, univariate_time_series, multivariate_time_series):
         preprocessor = ZNormalizer()
         preprocessor.fit(univariate_time_series)
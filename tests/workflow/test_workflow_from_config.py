@@ -1,4 +1,6 @@
 
+import os
+import sys
 import pytest
 import json
 import pathlib
@@ -73,6 +75,47 @@ class TestWorkflowFromConfig:
         workflow = workflow_from_config(str(tmp_path / 'config.json'))
         assert isinstance(workflow, Workflow)
 
+    def test_modified_file(self, tmp_path, valid_config):
+        with open(tmp_path / 'config.json', 'w') as file:
+            json.dump(valid_config, file)
+        assert len(workflow_from_config(str(tmp_path / 'config.json')).pipelines) == 4
+        assert len(workflow_from_config(str(tmp_path / 'config.json')).pipelines) == 4
+        valid_config['detectors'] = [{"type": "IsolationForest", "window_size": 50}]
+        with open(tmp_path / 'config.json', 'w') as file:
+            json.dump(valid_config, file)
+        assert len(workflow_from_config(str(tmp_path / 'config.json')).pipelines) == 2
+
+    def test_modified_file_same_modification_time(self, tmp_path, valid_config):
+        with open(tmp_path / 'config.json', 'w') as file:
+            json.dump(valid_config, file)
+        modification_time = os.stat(tmp_path / 'config.json').st_mtime_ns
+        assert len(workflow_from_config(str(tmp_path / 'config.json')).pipelines) == 4
+        valid_config['detectors'] = [{"type": "IsolationForest", "window_size": 50}]
+        with open(tmp_path / 'config.json', 'w') as file:
+            json.dump(valid_config, file)
+        os.utime(tmp_path / 'config.json', ns=(modification_time, modification_time))
+        assert len(workflow_from_config(str(tmp_path / 'config.json')).pipelines) == 2
+
+    def test_cached_config_not_modified(self, tmp_path, valid_config, monkeypatch):
+        with open(tmp_path / 'config.json', 'w') as file:
+            json.dump(valid_config, file)
+        nb_detectors = []
+
+        def interpret(config):
+            nb_detectors.append(len(config['detectors']))
+            config['detectors'].clear()
+
+        monkeypatch.setattr(sys.modules['dtaianomaly.workflow.workflow_from_config'], 'interpret_config', interpret)
+        workflow_from_config(str(tmp_path / 'config.json'))
+        workflow_from_config(str(tmp_path / 'config.json'))
+        assert nb_detectors == [len(valid_config['detectors'])] * 2
+
+    def test_invalid_json(self, tmp_path):
+        with open(tmp_path / 'config.json', 'a') as file:
+            file.write('{"detectors": ')
+        with pytest.raises(ValueError):
+            workflow_from_config(str(tmp_path / 'config.json'))
+
 
 class TestInterpretConfig:
 